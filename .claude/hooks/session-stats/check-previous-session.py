@@ -8,46 +8,78 @@ has unaggregated stats. If so, it outputs a prompt for Claude to ask
 the user if they want to generate a report.
 """
 import json
+import os
 from pathlib import Path
 
 CLAUDE_DIR = Path.home() / ".claude"
 STATS_DIR = Path(".claude/session_stats")
+CHUNK_BYTES = 64 * 1024
+
+
+def _iter_lines_reversed(history_file: Path):
+    """
+    Yield the lines of the history file from last to first.
+
+    The file is read backwards in CHUNK_BYTES blocks, so only as much of
+    it is read as the caller consumes.
+    """
+    with open(history_file, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        partial = b""
+        while pos > 0:
+            read_size = min(CHUNK_BYTES, pos)
+            pos -= read_size
+            f.seek(pos)
+            lines = (f.read(read_size) + partial).split(b"\n")
+            # The first piece may continue into the previous chunk
+            partial = lines[0]
+            yield from reversed(lines[1:])
+        yield partial
+
+
+def _latest_session_ids(lines) -> list:
+    """
+    Return up to two distinct sessionIds, most recent first.
+
+    history.jsonl is append-ordered, so scanning from the end and keeping
+    the first distinct IDs seen gives the most recent sessions. `lines`
+    must already be in reverse order.
+    """
+    seen = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            sid = json.loads(line).get("sessionId")
+        except json.JSONDecodeError:
+            continue
+        if sid and sid not in seen:
+            seen.append(sid)
+            if len(seen) == 2:
+                break
+    return seen
 
 
 def get_previous_session_id():
     """
     Find the most recent session that isn't the current one.
 
-    Returns the second-most-recent session ID by timestamp.
+    Returns the second-most-recent session ID in the history. The file
+    is scanned backwards from the end and reading stops as soon as two
+    sessions have been seen.
     """
     history_file = CLAUDE_DIR / "history.jsonl"
     if not history_file.exists():
         return None
 
-    sessions = {}
-    with open(history_file) as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entry = json.loads(line)
-                sid = entry.get("sessionId")
-                ts = entry.get("timestamp", 0)
-                if sid:
-                    if sid not in sessions or ts > sessions[sid]:
-                        sessions[sid] = ts
-            except json.JSONDecodeError:
-                continue
-
-    # Sort by timestamp descending
-    sorted_sessions = sorted(sessions.items(), key=lambda x: x[1], reverse=True)
+    seen = _latest_session_ids(_iter_lines_reversed(history_file))
 
     # Return the second session (previous, not current)
-    if len(sorted_sessions) < 2:
+    if len(seen) < 2:
         return None
 
-    return sorted_sessions[1][0]
+    return seen[1]
 
 
 def stats_exist(session_id: str) -> bool: